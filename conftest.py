@@ -1,5 +1,33 @@
 import os
 import sys
 
+import pytest
+
 # Add the project root directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests marked integration",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "integration: tests that need a running API server or a Mongo database, "
+        "skipped unless --run-integration is given",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="needs --run-integration to run")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
@@ -54,7 +54,7 @@ echo "=================================="
 echo ""
 
 # Run performance tests
-if python -m pytest tests/perf/ -v; then
+if python -m pytest tests/perf/ -v --run-integration; then
     echo ""
     echo -e "${GREEN}All performance tests passed!${NC}"
     TEST_RESULT=0
@@ -1,18 +1,47 @@
 import os
+import re
+from collections.abc import Iterable
 from datetime import datetime
+from functools import lru_cache
 
 import requests
 
 from src.smtp import SMTPClient
 
+_DATE_FORMAT = "%Y-%m-%d"
+_NIP_PATTERN = re.compile(r"[0-9]{10}")
+
+
+@lru_cache(maxsize=1024)
+def _is_nip_active(base_url: str, nip: str, date: str) -> bool:
+    """
+    Pyta API MF o status VAT dla NIPu w danym dniu.
+    Wyjątki nie są cache'owane, więc błędy sieci i API nie trafiają do cache.
+    """
+    response = requests.get(f"{base_url}/api/search/nip/{nip}?date={date}", timeout=10)
+    response.raise_for_status()
+    data = response.json()
+
+    # Sprawdzamy czy subject istnieje i czy statusVat == "Czynny"
+    subject = data.get("result", {}).get("subject")
+    return bool(subject and subject.get("statusVat") == "Czynny")
+
 
 class Account:
+    __slots__ = ("balance", "historia")
+
     balance: float
     express_transfer_fee: float = 0.0
+    history_label: str = "Account"
 
     def __init__(self, balance: float):
         self.balance = balance
-        self.historia = []
+        self.historia: list[float] = []
+
+    @property
+    def historia_snapshot(self) -> tuple[float, ...]:
+        """Immutable copy of the transfer history, historia stays the backing list."""
+        return tuple(self.historia)
 
     def incoming_transfer(self, amount: float):
         if amount > 0:
@@ -31,13 +60,65 @@ class Account:
             self.historia.append(-amount)
             self.historia.append(-self.express_transfer_fee)
 
+    def _build_subject(self) -> str:
+        today = datetime.now().strftime(_DATE_FORMAT)
+        return f"Account Transfer History {today}"
+
+    def _build_body(self) -> str:
+        return f"{self.history_label} account history: {self.historia}"
+
+    def send_history_via_email(
+        self, email_address: str, *, smtp_client: SMTPClient | None = None
+    ) -> bool:
+        """
+        Send account history via email.
+
+        Args:
+            email_address: Recipient email address
+            smtp_client: Client to send through, a new SMTPClient if None
+
+        Returns:
+            True if email was sent successfully, False otherwise
+        """
+        if smtp_client is None:
+            smtp_client = SMTPClient()
+        return smtp_client.send(
+            self._build_subject(), self._build_body(), email_address
+        )
+
+    @staticmethod
+    def send_histories_bulk(
+        recipients: Iterable[tuple["Account", str]],
+        smtp_client: SMTPClient | None = None,
+    ) -> int:
+        """
+        Send the history of many accounts through a single SMTP client.
+
+        Args:
+            recipients: (account, email_address) pairs
+            smtp_client: Client shared by all sends, a new SMTPClient if None
+
+        Returns:
+            Number of emails sent successfully
+        """
+        if smtp_client is None:
+            smtp_client = SMTPClient()
+        sent = 0
+        for account, email_address in recipients:
+            if account.send_history_via_email(email_address, smtp_client=smtp_client):
+                sent += 1
+        return sent
+
 
 class PersonalAccount(Account):
+    __slots__ = ("first_name", "last_name", "pesel", "promo_code")
+
     first_name: str
     last_name: str
     pesel: str
     promo_code: str | None
     express_transfer_fee: float = 1.0
+    history_label: str = "Personal"
 
     def __init__(
         self,
@@ -68,22 +149,24 @@ class PersonalAccount(Account):
             self.balance += 50
             self.historia.append(50)
 
-    def _check_loan_condition_1(self) -> bool:
-        if len(self.historia) < 3:
+    @staticmethod
+    def _check_loan_condition_1(recent: list) -> bool:
+        if len(recent) < 3:
             return False
-        last_three = self.historia[-3:]
-        return all(t > 0 for t in last_three)
+        return all(t > 0 for t in recent[-3:])
 
-    def _check_loan_condition_2(self, amount: float) -> bool:
-        if len(self.historia) < 5:
+    @staticmethod
+    def _check_loan_condition_2(recent: list, amount: float) -> bool:
+        if len(recent) < 5:
             return False
-        sum_last_five = sum(self.historia[-5:])
-        return sum_last_five > amount
+        return sum(recent) > amount
 
     def submit_for_loan(self, amount: float) -> bool:
-        is_granted = self._check_loan_condition_1() or self._check_loan_condition_2(
-            amount
-        )
+        # Both conditions only look at the tail, so slice it once
+        recent = self.historia[-5:]
+        is_granted = self._check_loan_condition_1(
+            recent
+        ) or self._check_loan_condition_2(recent, amount)
 
         if is_granted:
             self.balance += amount
@@ -92,34 +175,20 @@ class PersonalAccount(Account):
         else:
             return False
 
-    def send_history_via_email(self, email_address: str) -> bool:
-        """
-        Send account history via email.
-
-        Args:
-            email_address: Recipient email address
-
-        Returns:
-            True if email was sent successfully, False otherwise
-        """
-        today = datetime.now().strftime("%Y-%m-%d")
-        subject = f"Account Transfer History {today}"
-        text = f"Personal account history: {self.historia}"
-
-        smtp_client = SMTPClient()
-        return smtp_client.send(subject, text, email_address)
-
 
 class BusinessAccount(Account):
+    __slots__ = ("company_name", "nip")
+
     company_name: str
     nip: str
     express_transfer_fee: float = 5.0
+    history_label: str = "Company"
 
     def __init__(self, company_name: str, nip: str, promo_code: str | None = None):
         super().__init__(balance=0.0)
         self.company_name = company_name
 
-        if len(nip) == 10 and nip.isdigit():
+        if _NIP_PATTERN.fullmatch(nip):
             self.nip = nip
             # Walidacja NIPu przez API MF
             if not self.validate_nip_in_mf(nip):
@@ -131,24 +200,18 @@ class BusinessAccount(Account):
         """
         Waliduje NIP przez API Ministerstwa Finansów.
         Zwraca True jeżeli statusVat == "Czynny", False w przeciwnym razie.
+        Odpowiedzi są cache'owane per (URL API, NIP, dzień).
         """
         base_url = os.getenv("BANK_APP_MF_URL", "https://wl-test.mf.gov.pl")
-        today = datetime.now().strftime("%Y-%m-%d")
-        url = f"{base_url}/api/search/nip/{nip}?date={today}"
+        today = datetime.now().strftime(_DATE_FORMAT)
 
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            # Sprawdzamy czy subject istnieje i czy statusVat == "Czynny"
-            subject = data.get("result", {}).get("subject")
-            if subject and subject.get("statusVat") == "Czynny":
-                return True
-            return False
+            return _is_nip_active(base_url, nip, today)
         except Exception:
             return False
 
+    validate_nip_in_mf.cache_clear = _is_nip_active.cache_clear
+
     def take_loan(self, amount: float) -> bool:
         condition_1 = self.balance >= (amount * 2)
 
@@ -160,20 +223,3 @@ class BusinessAccount(Account):
             return True
         else:
             return False
-
-    def send_history_via_email(self, email_address: str) -> bool:
-        """
-        Send account history via email.
-
-        Args:
-            email_address: Recipient email address
-
-        Returns:
-            True if email was sent successfully, False otherwise
-        """
-        today = datetime.now().strftime("%Y-%m-%d")
-        subject = f"Account Transfer History {today}"
-        text = f"Company account history: {self.historia}"
-
-        smtp_client = SMTPClient()
-        return smtp_client.send(subject, text, email_address)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from src.account import PersonalAccount
 
@@ -24,6 +24,10 @@ class AccountRepositoryInterface(ABC):
         """Get all accounts"""
         pass
 
+    def iter_all(self) -> Iterator[PersonalAccount]:
+        """Iterate over all accounts, backends may override to avoid a copy"""
+        return iter(self.get_all())
+
     @abstractmethod
     def count(self) -> int:  # pragma: no cover
         """Get the total number of accounts"""
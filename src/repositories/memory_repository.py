@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from src.account import PersonalAccount
 from src.repositories import AccountRepositoryInterface
@@ -8,22 +8,24 @@ class InMemoryAccountRepository(AccountRepositoryInterface):
     """In-memory implementation of account repository"""
 
     def __init__(self):
-        self._accounts: List[PersonalAccount] = []
+        # Keyed by PESEL, dict insertion order keeps get_all() in add order
+        self._accounts: Dict[str, PersonalAccount] = {}
 
     def add(self, account: PersonalAccount) -> None:
         """Add an account to the repository"""
-        self._accounts.append(account)
+        self._accounts[account.pesel] = account
 
     def find_by_pesel(self, pesel: str) -> Optional[PersonalAccount]:
         """Find an account by PESEL"""
-        for account in self._accounts:
-            if account.pesel == pesel:
-                return account
-        return None
+        return self._accounts.get(pesel)
 
     def get_all(self) -> List[PersonalAccount]:
         """Get all accounts"""
-        return self._accounts.copy()
+        return list(self._accounts.values())
+
+    def iter_all(self) -> Iterator[PersonalAccount]:
+        """Iterate over stored accounts without copying, do not mutate meanwhile"""
+        return iter(self._accounts.values())
 
     def count(self) -> int:
         """Get the total number of accounts"""
@@ -49,12 +51,7 @@ class InMemoryAccountRepository(AccountRepositoryInterface):
 
     def delete(self, pesel: str) -> bool:
         """Delete an account by PESEL"""
-        account = self.find_by_pesel(pesel)
-        if account is None:
-            return False
-
-        self._accounts.remove(account)
-        return True
+        return self._accounts.pop(pesel, None) is not None
 
     def clear(self) -> None:
         """Clear all accounts from the repository"""
@@ -62,9 +59,9 @@ class InMemoryAccountRepository(AccountRepositoryInterface):
 
     def save_all(self, accounts: List[PersonalAccount]) -> int:
         """Persist all provided accounts, replacing existing data"""
-        self._accounts = [account for account in accounts]
+        self._accounts = {account.pesel: account for account in accounts}
         return len(self._accounts)
 
     def load_all(self) -> List[PersonalAccount]:
         """Load accounts from the in-memory storage"""
-        return self._accounts.copy()
+        return list(self._accounts.values())
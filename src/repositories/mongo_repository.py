@@ -55,6 +55,10 @@ class MongoAccountsRepository(AccountRepositoryInterface):
 
         self.db = self.client[database_name]
         self.collection = self.db[collection_name]
+        self._ensure_indexes()
+
+    def _ensure_indexes(self) -> None:
+        """Create the indexes the repository relies on; a no-op when they exist."""
         # Ensure PESEL uniqueness for safety; mongomock supports create_index as well.
         self.collection.create_index("pesel", unique=True)
 
@@ -130,6 +134,11 @@ class MongoAccountsRepository(AccountRepositoryInterface):
         """Clear all accounts from the repository."""
         self.collection.delete_many({})
 
+    def drop_collection(self) -> None:
+        """Drop the whole collection in one call and restore its indexes."""
+        self.collection.drop()
+        self._ensure_indexes()
+
     def save_all(self, accounts: List[PersonalAccount]) -> int:
         """Persist all provided accounts, replacing existing data, and return count saved."""
         self.collection.delete_many({})
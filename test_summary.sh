@@ -30,7 +30,7 @@ echo ""
 echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
 echo -e "${BLUE}1. Unit Tests${NC}"
 echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-python -m pytest tests/unit/ -v --tb=line
+python -m pytest tests/unit/ -v --tb=line -n auto --dist=loadfile
 UNIT_RESULT=$?
 
 echo ""
@@ -63,7 +63,7 @@ sleep 5
 
 if curl -s http://localhost:5000/ > /dev/null 2>&1; then
     echo -e "${GREEN}Flask running (PID: $FLASK_PID)${NC}"
-    python -m pytest tests/perf/ -v --tb=line
+    python -m pytest tests/perf/ -v --tb=line --run-integration
     PERF_RESULT=$?
     kill $FLASK_PID 2>/dev/null || true
     echo -e "${GREEN}Flask stopped${NC}"
@@ -0,0 +1,213 @@
+import os
+import pickle
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from mongomock import MongoClient
+
+try:
+    from pymongo import MongoClient as PyMongoClient
+except Exception:  # pragma: no cover - optional dependency
+    PyMongoClient = None
+
+from src.account import BusinessAccount, PersonalAccount
+from src.registry import AccountRegistry
+from src.repositories.memory_repository import InMemoryAccountRepository
+from src.repositories.mongo_repository import MongoAccountsRepository
+
+# Prototype accounts are pickled once, fixtures hand out fresh unpickled copies
+_JAN_BLOB = pickle.dumps(PersonalAccount("Jan", "Kowalski", 100.0, "80010112345"))
+_ANNA_BLOB = pickle.dumps(PersonalAccount("Anna", "Nowak", 200.0, "90020254321"))
+_PERSONAL_BLOB = pickle.dumps(PersonalAccount("Jan", "Kowalski", 100.0, "06241114012"))
+
+
+@pytest.fixture
+def account_jan():
+    return pickle.loads(_JAN_BLOB)
+
+
+@pytest.fixture
+def account_anna():
+    return pickle.loads(_ANNA_BLOB)
+
+
+@pytest.fixture
+def personal_account():
+    return pickle.loads(_PERSONAL_BLOB)
+
+
+@pytest.fixture(scope="session")
+def _business_blob(vat_stub):
+    # Built lazily, the NIP check in __init__ needs the VAT stub to be active
+    account = BusinessAccount("Test Corp", "1234567890")
+    account.balance = 100.0
+    return pickle.dumps(account)
+
+
+@pytest.fixture
+def business_account(_business_blob):
+    """Business account with an active NIP and a balance of 100"""
+    return pickle.loads(_business_blob)
+
+
+@pytest.fixture
+def registry():
+    """Empty registry on the default in-memory repository"""
+    return AccountRegistry()
+
+
+@pytest.fixture
+def memory_repo():
+    """Fixture for InMemoryAccountRepository"""
+    return InMemoryAccountRepository()
+
+
+@pytest.fixture(scope="session")
+def mongomock_client():
+    """One mongomock client for the whole unit test session"""
+    client = MongoClient()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def _session_mongo_repo(mongomock_client):
+    # One database per pytest-xdist worker, so parallel runs never share state
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return MongoAccountsRepository(
+        client=mongomock_client,
+        database_name=f"test_bank_app_{worker}",
+        collection_name="repository_accounts",
+    )
+
+
+@pytest.fixture
+def mongo_repo(_session_mongo_repo):
+    """Session-wide mongomock-backed repository, emptied after each test"""
+    yield _session_mongo_repo
+    _session_mongo_repo.drop_collection()
+
+
+@pytest.fixture(scope="session")
+def _session_integration_repo(mongomock_client):
+    """
+    Repository for the registry integration tests. Runs against the real server
+    at UNIT_TEST_MONGO_URI when set, else on mongomock.
+    """
+    mongo_uri = os.getenv("UNIT_TEST_MONGO_URI")
+    if mongo_uri:
+        if PyMongoClient is None:
+            pytest.skip("pymongo is required to run against a real Mongo instance")
+        client = PyMongoClient(mongo_uri)
+    else:
+        client = mongomock_client
+
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    repo = MongoAccountsRepository(
+        client=client,
+        database_name=f"test_bank_app_{worker}",
+        collection_name="registry_accounts",
+    )
+    yield repo
+    if mongo_uri:
+        repo.drop_collection()
+        client.close()
+
+
+@pytest.fixture
+def integration_mongo_repo(_session_integration_repo):
+    """Integration repository, restored to its pre-test documents after each test"""
+    # mongomock has no transactions, so snapshot and restore stands in for rollback
+    repo = _session_integration_repo
+    snapshot = list(repo.collection.find())
+    yield repo
+    repo.drop_collection()
+    if snapshot:
+        repo.collection.insert_many(snapshot)
+
+
+@pytest.fixture(autouse=True)
+def clear_nip_cache():
+    """Keep cached MF lookups from leaking between tests"""
+    BusinessAccount.validate_nip_in_mf.cache_clear()
+    yield
+    BusinessAccount.validate_nip_in_mf.cache_clear()
+
+
+class StubSMTP:
+    """SMTPClient double recording each send() as a (subject, text, email) tuple"""
+
+    def __init__(self, *results: bool):
+        self.results = list(results)
+        self.calls = []
+
+    def send(self, subject: str, text: str, email_address: str) -> bool:
+        self.calls.append((subject, text, email_address))
+        return self.results.pop(0) if self.results else True
+
+
+@pytest.fixture
+def smtp_stub():
+    """SMTP double to pass as send_history_via_email(smtp_client=...)"""
+    return StubSMTP()
+
+
+_DEFAULT_DATE = "2025-01-08"
+
+
+class _StubNow:
+    __slots__ = ("date",)
+
+    def __init__(self, date):
+        self.date = date
+
+    def strftime(self, fmt):
+        return self.date
+
+
+class _StubDatetime:
+    """Stand-in for src.account.datetime, now() formats to the current date"""
+
+    date = _DEFAULT_DATE
+
+    @classmethod
+    def now(cls):
+        return _StubNow(cls.date)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _stub_datetime():
+    """Pin today's date in src.account for the whole unit test session"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.account.datetime", _StubDatetime)
+        yield
+
+
+@pytest.fixture
+def set_date():
+    """Change the pinned date for one test, reset to the default afterwards"""
+
+    def _set(date):
+        _StubDatetime.date = date
+
+    yield _set
+    _StubDatetime.date = _DEFAULT_DATE
+
+
+_VAT_OK = {"result": {"subject": {"nip": "1234567890", "statusVat": "Czynny"}}}
+
+
+@pytest.fixture(scope="session")
+def vat_stub():
+    """
+    Answer every MF API lookup with an active VAT payer, never the network.
+    Requested by the business fixtures and tests only, so runs that select no
+    business test skip the patch; once active it stays on for the session.
+    """
+    response = MagicMock(spec=requests.Response)
+    response.status_code = 200
+    response.json.return_value = _VAT_OK
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.account.requests.get", lambda *args, **kwargs: response)
+        yield response
@@ -55,3 +55,19 @@ class TestAccount:
         assert account.promo_code == promo_code
         assert account.balance == expected_balance
         assert account.historia == expected_history
+
+    def test_account_has_no_instance_dict(self, basic_account_details):
+        account = PersonalAccount(**basic_account_details, pesel="06241114012")
+        assert not hasattr(account, "__dict__")
+        with pytest.raises(AttributeError):
+            account.nickname = "Johnny"
+
+    def test_historia_snapshot_is_immutable_copy(self, basic_account_details):
+        account = PersonalAccount(**basic_account_details, pesel="06241114012")
+        account.incoming_transfer(50.0)
+
+        snapshot = account.historia_snapshot
+        account.incoming_transfer(25.0)
+
+        assert snapshot == (50.0,)
+        assert account.historia_snapshot == (50.0, 25.0)
@@ -1,10 +1,40 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pytest
+import requests
 
 from src.account import BusinessAccount
 
 
+def _vat_response(subject):
+    """Build a mocked MF API response carrying the given subject"""
+    response = MagicMock(spec=requests.Response)
+    response.status_code = 200
+    response.json.return_value = {"result": {"subject": subject}}
+    return response
+
+
+_ACTIVE_RESP = _vat_response({"nip": "1234567890", "statusVat": "Czynny"})
+_INACTIVE_RESP = _vat_response({"nip": "0987654321", "statusVat": "Nieczynny"})
+_MISSING_RESP = _vat_response(None)
+
+
+@pytest.fixture(scope="class")
+def _patched_get():
+    """One requests.get patch shared by all tests of a class"""
+    mock_get = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.account.requests.get", mock_get)
+        yield mock_get
+
+
+@pytest.fixture
+def mock_get(_patched_get):
+    """The shared requests.get mock, with calls and configured results cleared"""
+    _patched_get.reset_mock(return_value=True, side_effect=True)
+    return _patched_get
+
+
 class TestBusinessAccount:
     @pytest.mark.parametrize(
         #
@@ -13,6 +43,7 @@ class TestBusinessAccount:
             ("Firma Krótka", "123", "Invalid"),
             ("Firma Długa", "12345678901", "Invalid"),
             ("Firma Litery", "123456789A", "Invalid"),
+            ("Firma Unicode", "１２３４５６７８９０", "Invalid"),
         ],
     )
     def test_business_account_creation_invalid_nip_length(
@@ -25,45 +56,39 @@ class TestBusinessAccount:
         assert account.balance == 0.0
         assert account.historia == []
 
-    @patch("src.account.requests.get")
-    def test_business_account_valid_nip_active(self, mock_get):
-        """Test dla poprawnego NIPu z statusem Czynny"""
-        mock_response = mock_get.return_value
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "result": {"subject": {"nip": "1234567890", "statusVat": "Czynny"}}
-        }
+    def test_business_account_has_no_instance_dict(self):
+        """Test że BusinessAccount trzyma atrybuty w __slots__, bez __dict__"""
+        account = BusinessAccount("Firma Krótka", "123")
+        assert not hasattr(account, "__dict__")
+        with pytest.raises(AttributeError):
+            account.regon = "123456789"
+
+    @pytest.mark.parametrize("promo_code", [None, "PROM_123"])
+    def test_business_account_valid_nip_active(self, mock_get, promo_code):
+        """Test dla poprawnego NIPu z statusem Czynny - kod promocyjny nie daje bonusu"""
+        mock_get.return_value = _ACTIVE_RESP
 
-        account = BusinessAccount("Firma XYZ", "1234567890")
+        account = BusinessAccount("Firma XYZ", "1234567890", promo_code)
         assert account.company_name == "Firma XYZ"
         assert account.nip == "1234567890"
         assert account.balance == 0.0
         assert account.historia == []
         mock_get.assert_called_once()
 
-    @patch("src.account.requests.get")
     def test_business_account_nip_not_active(self, mock_get):
         """Test dla NIPu który nie jest czynny - rzuca błąd"""
-        mock_response = mock_get.return_value
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "result": {"subject": {"nip": "0987654321", "statusVat": "Nieczynny"}}
-        }
+        mock_get.return_value = _INACTIVE_RESP
 
         with pytest.raises(ValueError, match="Company not registered!!"):
             BusinessAccount("Firma Poprawna", "0987654321")
 
-    @patch("src.account.requests.get")
     def test_business_account_nip_not_found(self, mock_get):
         """Test dla NIPu który nie istnieje w bazie MF"""
-        mock_response = mock_get.return_value
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"result": {"subject": None}}
+        mock_get.return_value = _MISSING_RESP
 
         with pytest.raises(ValueError, match="Company not registered!!"):
             BusinessAccount("Firma Nieistniejąca", "1111111111")
 
-    @patch("src.account.requests.get")
     def test_business_account_api_error(self, mock_get):
         """Test gdy API zwraca błąd"""
         mock_get.side_effect = Exception("API Error")
@@ -71,47 +96,37 @@ class TestBusinessAccount:
         with pytest.raises(ValueError, match="Company not registered!!"):
             BusinessAccount("Firma Test", "9999999999")
 
-    @patch("src.account.requests.get")
-    def test_business_account_no_promo_bonus(self, mock_get):
-        """Test że kod promocyjny nie działa dla kont firmowych"""
-        mock_response = mock_get.return_value
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "result": {"subject": {"nip": "1234567890", "statusVat": "Czynny"}}
-        }
+    def test_validate_nip_in_mf_method(self, mock_get):
+        """Test metody validate_nip_in_mf z mockowaniem"""
+        mock_get.return_value = _ACTIVE_RESP
 
-        account = BusinessAccount("Firma z Kodem", "1234567890", "PROM_123")
-        assert account.balance == 0.0
-        assert account.historia == []
+        account = BusinessAccount("Test Company", "8461627563")
+        result = account.validate_nip_in_mf("8461627563")
+        assert result is True
 
-    def test_validate_nip_in_mf_method(self):
-        """Test metody validate_nip_in_mf z mockowaniem"""
-        with patch("src.account.requests.get") as mock_get:
-            mock_response = mock_get.return_value
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "result": {"subject": {"nip": "8461627563", "statusVat": "Czynny"}}
-            }
-
-            account = BusinessAccount("Test Company", "8461627563")
-            result = account.validate_nip_in_mf("8461627563")
-            assert result is True
-
-    def test_validate_nip_in_mf_returns_false_for_inactive(self):
+    def test_validate_nip_in_mf_returns_false_for_inactive(self, mock_get):
         """Test że validate_nip_in_mf zwraca False dla nieaktywnych"""
-        with patch("src.account.requests.get") as mock_get:
-            mock_response = mock_get.return_value
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"result": {"subject": None}}
-
-            # Musimy stworzyć instancję z poprawnym NIPem najpierw
-            with patch("src.account.requests.get") as mock_get_init:
-                mock_response_init = mock_get_init.return_value
-                mock_response_init.status_code = 200
-                mock_response_init.json.return_value = {
-                    "result": {"subject": {"nip": "1234567890", "statusVat": "Czynny"}}
-                }
-                account = BusinessAccount("Test", "1234567890")
-
-            result = account.validate_nip_in_mf("9999999999")
-            assert result is False
+        # Musimy stworzyć instancję z poprawnym NIPem najpierw
+        mock_get.return_value = _ACTIVE_RESP
+        account = BusinessAccount("Test", "1234567890")
+
+        mock_get.return_value = _MISSING_RESP
+        result = account.validate_nip_in_mf("9999999999")
+        assert result is False
+
+    def test_validate_nip_in_mf_is_cached_per_nip(self, mock_get):
+        """Test że drugi BusinessAccount z tym samym NIPem nie pyta ponownie API"""
+        mock_get.return_value = _ACTIVE_RESP
+
+        BusinessAccount("Firma A", "1234567890")
+        BusinessAccount("Firma B", "1234567890")
+        mock_get.assert_called_once()
+
+    def test_validate_nip_in_mf_does_not_cache_errors(self, mock_get):
+        """Test że błąd API nie zostaje zapamiętany"""
+        mock_get.side_effect = [Exception("API Error"), _ACTIVE_RESP]
+
+        with pytest.raises(ValueError, match="Company not registered!!"):
+            BusinessAccount("Firma Test", "1234567890")
+        account = BusinessAccount("Firma Test", "1234567890")
+        assert account.nip == "1234567890"
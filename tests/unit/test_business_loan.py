@@ -1,20 +1,5 @@
-from unittest.mock import patch
-
 import pytest
 
-from src.account import BusinessAccount
-
-
-@pytest.fixture
-def business_account():
-    with patch("src.account.requests.get") as mock_get:
-        mock_response = mock_get.return_value
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "result": {"subject": {"nip": "1234567890", "statusVat": "Czynny"}}
-        }
-        return BusinessAccount("Test Corp", "1234567890")
-
 
 @pytest.mark.parametrize(
     "balance, history, loan_amount, expected_result, expected_balance",
@@ -40,4 +25,4 @@ def test_take_loan(
     granted = business_account.take_loan(loan_amount)
 
     assert granted is expected_result
-    assert business_account.balance == expected_balance
+    assert business_account.balance == pytest.approx(expected_balance)
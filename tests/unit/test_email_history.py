@@ -1,261 +1,194 @@
-from datetime import datetime
-from unittest.mock import MagicMock, patch
-
 import pytest
 
-from src.account import BusinessAccount, PersonalAccount
-
-
-class TestPersonalAccountEmailHistory:
-    """Tests for PersonalAccount.send_history_via_email method"""
-
-    @patch("src.account.SMTPClient")
-    @patch("src.account.datetime")
-    def test_send_history_via_email_called_with_correct_params(
-        self, mock_datetime, mock_smtp_class
-    ):
-        """Test that SMTPClient.send is called with correct parameters"""
-        mock_datetime.now.return_value.strftime.return_value = "2025-01-08"
-        mock_smtp_instance = MagicMock()
-        mock_smtp_instance.send.return_value = True
-        mock_smtp_class.return_value = mock_smtp_instance
-
-        account = PersonalAccount("Jan", "Kowalski", 1000.0, "65010112345")
-        account.incoming_transfer(100)
-        account.outgoing_transfer(50)
-
-        result = account.send_history_via_email("test@example.com")
+from src.account import Account, BusinessAccount, PersonalAccount
 
-        mock_smtp_instance.send.assert_called_once_with(
-            "Account Transfer History 2025-01-08",
-            "Personal account history: [100, -50]",
-            "test@example.com",
-        )
-        assert result is True
-
-    @patch("src.account.SMTPClient")
-    @patch("src.account.datetime")
-    def test_send_history_via_email_returns_true_on_success(
-        self, mock_datetime, mock_smtp_class
-    ):
-        """Test that method returns True when email is sent successfully"""
-        mock_datetime.now.return_value.strftime.return_value = "2025-01-08"
-        mock_smtp_instance = MagicMock()
-        mock_smtp_instance.send.return_value = True
-        mock_smtp_class.return_value = mock_smtp_instance
 
-        account = PersonalAccount("Jan", "Kowalski", 1000.0, "65010112345")
-        account.incoming_transfer(500)
+def _apply_transfers(account, transfers):
+    """Book positive amounts as incoming and negative ones as outgoing"""
+    for amount in transfers:
+        if amount > 0:
+            account.incoming_transfer(amount)
+        else:
+            account.outgoing_transfer(-amount)
 
-        result = account.send_history_via_email("test@example.com")
 
-        assert result is True
-        assert mock_smtp_instance.send.call_count == 1
+class TestPersonalAccountEmailHistory:
+    """Tests for PersonalAccount.send_history_via_email method"""
 
-    @patch("src.account.SMTPClient")
-    @patch("src.account.datetime")
-    def test_send_history_via_email_returns_false_on_failure(
-        self, mock_datetime, mock_smtp_class
+    @pytest.mark.parametrize(
+        "today, transfers, subject, body, send_ret, email",
+        [
+            pytest.param(
+                "2025-01-08",
+                [100, -50],
+                "Account Transfer History 2025-01-08",
+                "Personal account history: [100, -50]",
+                True,
+                "test@example.com",
+                id="correct_params",
+            ),
+            pytest.param(
+                "2025-01-08",
+                [-100],
+                "Account Transfer History 2025-01-08",
+                "Personal account history: [-100]",
+                False,
+                "test@example.com",
+                id="send_failure",
+            ),
+            pytest.param(
+                "2025-01-08",
+                [],
+                "Account Transfer History 2025-01-08",
+                "Personal account history: []",
+                True,
+                "test@example.com",
+                id="empty_history",
+            ),
+            pytest.param(
+                "2025-12-10",
+                [100, -1, 500],
+                "Account Transfer History 2025-12-10",
+                "Personal account history: [100, -1, 500]",
+                True,
+                "jan@example.com",
+                id="multiple_transfers",
+            ),
+        ],
+    )
+    def test_send_history_via_email(
+        self, smtp_stub, set_date, today, transfers, subject, body, send_ret, email
     ):
-        """Test that method returns False when email sending fails"""
-        mock_datetime.now.return_value.strftime.return_value = "2025-01-08"
-        mock_smtp_instance = MagicMock()
-        mock_smtp_instance.send.return_value = False
-        mock_smtp_class.return_value = mock_smtp_instance
+        """Test that the history is mailed once and the send result is returned"""
+        set_date(today)
+        smtp_stub.results = [send_ret]
 
         account = PersonalAccount("Jan", "Kowalski", 1000.0, "65010112345")
-        account.outgoing_transfer(100)
+        _apply_transfers(account, transfers)
 
-        result = account.send_history_via_email("test@example.com")
+        result = account.send_history_via_email(email, smtp_client=smtp_stub)
 
-        assert result is False
-        assert mock_smtp_instance.send.call_count == 1
+        assert smtp_stub.calls == [(subject, body, email)]
+        assert result is send_ret
 
-    @patch("src.account.SMTPClient")
-    @patch("src.account.datetime")
-    def test_send_history_with_empty_history(self, mock_datetime, mock_smtp_class):
-        """Test sending email with empty account history"""
-        mock_datetime.now.return_value.strftime.return_value = "2025-01-08"
-        mock_smtp_instance = MagicMock()
-        mock_smtp_instance.send.return_value = True
-        mock_smtp_class.return_value = mock_smtp_instance
+    def test_send_history_defaults_to_new_smtp_client(self, monkeypatch, smtp_stub):
+        """Test that a fresh SMTPClient is used when none is passed in"""
+        monkeypatch.setattr("src.account.SMTPClient", lambda: smtp_stub)
 
         account = PersonalAccount("Jan", "Kowalski", 1000.0, "65010112345")
-
         result = account.send_history_via_email("test@example.com")
 
-        mock_smtp_instance.send.assert_called_once_with(
-            "Account Transfer History 2025-01-08",
-            "Personal account history: []",
-            "test@example.com",
-        )
-        assert result is True
-
-    @patch("src.account.SMTPClient")
-    @patch("src.account.datetime")
-    def test_send_history_with_multiple_transfers(self, mock_datetime, mock_smtp_class):
-        """Test sending email with multiple transfers in history"""
-        mock_datetime.now.return_value.strftime.return_value = "2025-12-10"
-        mock_smtp_instance = MagicMock()
-        mock_smtp_instance.send.return_value = True
-        mock_smtp_class.return_value = mock_smtp_instance
-
-        account = PersonalAccount("Jan", "Kowalski", 1000.0, "65010112345")
-        account.incoming_transfer(100)
-        account.outgoing_transfer(1)
-        account.incoming_transfer(500)
-
-        result = account.send_history_via_email("jan@example.com")
-
-        mock_smtp_instance.send.assert_called_once_with(
-            "Account Transfer History 2025-12-10",
-            "Personal account history: [100, -1, 500]",
-            "jan@example.com",
-        )
+        assert smtp_stub.calls == [
+            (
+                "Account Transfer History 2025-01-08",
+                "Personal account history: []",
+                "test@example.com",
+            )
+        ]
         assert result is True
 
 
+@pytest.mark.usefixtures("vat_stub")
 class TestBusinessAccountEmailHistory:
     """Tests for BusinessAccount.send_history_via_email method"""
 
-    @patch("src.account.BusinessAccount.validate_nip_in_mf")
-    @patch("src.account.SMTPClient")
-    @patch("src.account.datetime")
-    def test_send_history_via_email_called_with_correct_params(
-        self, mock_datetime, mock_smtp_class, mock_validate_nip
+    @pytest.mark.parametrize(
+        "today, transfers, subject, body, send_ret, email",
+        [
+            pytest.param(
+                "2025-01-08",
+                [5000, -1000, 500],
+                "Account Transfer History 2025-01-08",
+                "Company account history: [5000, -1000, 500]",
+                True,
+                "company@example.com",
+                id="correct_params",
+            ),
+            pytest.param(
+                "2025-01-08",
+                [5000],
+                "Account Transfer History 2025-01-08",
+                "Company account history: [5000]",
+                False,
+                "company@example.com",
+                id="send_failure",
+            ),
+            pytest.param(
+                "2025-01-08",
+                [],
+                "Account Transfer History 2025-01-08",
+                "Company account history: []",
+                True,
+                "company@example.com",
+                id="empty_history",
+            ),
+            pytest.param(
+                "2025-12-25",
+                [1000],
+                "Account Transfer History 2025-12-25",
+                "Company account history: [1000]",
+                True,
+                "test@example.com",
+                id="different_date",
+            ),
+            pytest.param(
+                "2025-01-08",
+                [5000, -1000],
+                "Account Transfer History 2025-01-08",
+                "Company account history: [5000, -1000]",
+                True,
+                "business@example.com",
+                id="two_transfers",
+            ),
+        ],
+    )
+    def test_send_history_via_email(
+        self, smtp_stub, set_date, today, transfers, subject, body, send_ret, email
     ):
-        """Test that SMTPClient.send is called with correct parameters for business account"""
-        mock_validate_nip.return_value = True
-        mock_datetime.now.return_value.strftime.return_value = "2025-01-08"
-        mock_smtp_instance = MagicMock()
-        mock_smtp_instance.send.return_value = True
-        mock_smtp_class.return_value = mock_smtp_instance
+        """Test that the history is mailed once and the send result is returned"""
+        set_date(today)
+        smtp_stub.results = [send_ret]
 
         account = BusinessAccount("Test Company", "1234567890")
-        account.incoming_transfer(5000)
-        account.outgoing_transfer(1000)
-        account.incoming_transfer(500)
+        _apply_transfers(account, transfers)
 
-        result = account.send_history_via_email("company@example.com")
+        result = account.send_history_via_email(email, smtp_client=smtp_stub)
 
-        mock_smtp_instance.send.assert_called_once_with(
-            "Account Transfer History 2025-01-08",
-            "Company account history: [5000, -1000, 500]",
-            "company@example.com",
-        )
-        assert result is True
+        assert smtp_stub.calls == [(subject, body, email)]
+        assert result is send_ret
 
-    @patch("src.account.BusinessAccount.validate_nip_in_mf")
-    @patch("src.account.SMTPClient")
-    @patch("src.account.datetime")
-    def test_send_history_via_email_returns_true_on_success(
-        self, mock_datetime, mock_smtp_class, mock_validate_nip
-    ):
-        """Test that method returns True when email is sent successfully"""
-        mock_validate_nip.return_value = True
-        mock_datetime.now.return_value.strftime.return_value = "2025-01-08"
-        mock_smtp_instance = MagicMock()
-        mock_smtp_instance.send.return_value = True
-        mock_smtp_class.return_value = mock_smtp_instance
-
-        account = BusinessAccount("Test Company", "1234567890")
-        account.incoming_transfer(10000)
-
-        result = account.send_history_via_email("company@example.com")
-
-        assert result is True
-        assert mock_smtp_instance.send.call_count == 1
-
-    @patch("src.account.BusinessAccount.validate_nip_in_mf")
-    @patch("src.account.SMTPClient")
-    @patch("src.account.datetime")
-    def test_send_history_via_email_returns_false_on_failure(
-        self, mock_datetime, mock_smtp_class, mock_validate_nip
-    ):
-        """Test that method returns False when email sending fails"""
-        mock_validate_nip.return_value = True
-        mock_datetime.now.return_value.strftime.return_value = "2025-01-08"
-        mock_smtp_instance = MagicMock()
-        mock_smtp_instance.send.return_value = False
-        mock_smtp_class.return_value = mock_smtp_instance
 
-        account = BusinessAccount("Test Company", "1234567890")
-        account.incoming_transfer(5000)
+@pytest.mark.usefixtures("vat_stub")
+class TestSendHistoriesBulk:
+    """Tests for Account.send_histories_bulk"""
 
-        result = account.send_history_via_email("company@example.com")
+    def test_bulk_send_uses_single_client(self, monkeypatch, smtp_stub):
+        """Test that every history goes through one SMTPClient instance"""
+        created = []
 
-        assert result is False
-        assert mock_smtp_instance.send.call_count == 1
+        def _factory():
+            created.append(smtp_stub)
+            return smtp_stub
 
-    @patch("src.account.BusinessAccount.validate_nip_in_mf")
-    @patch("src.account.SMTPClient")
-    @patch("src.account.datetime")
-    def test_send_history_with_empty_history(
-        self, mock_datetime, mock_smtp_class, mock_validate_nip
-    ):
-        """Test sending email with empty business account history"""
-        mock_validate_nip.return_value = True
-        mock_datetime.now.return_value.strftime.return_value = "2025-01-08"
-        mock_smtp_instance = MagicMock()
-        mock_smtp_instance.send.return_value = True
-        mock_smtp_class.return_value = mock_smtp_instance
+        monkeypatch.setattr("src.account.SMTPClient", _factory)
+        smtp_stub.results = [True, False, True]
 
-        account = BusinessAccount("Test Company", "1234567890")
+        personal = PersonalAccount("Jan", "Kowalski", 1000.0, "65010112345")
+        personal.incoming_transfer(100)
+        business = BusinessAccount("Test Company", "1234567890")
+        recipients = [
+            (personal, "jan@example.com"),
+            (business, "company@example.com"),
+            (personal, "copy@example.com"),
+        ]
 
-        result = account.send_history_via_email("company@example.com")
+        sent = Account.send_histories_bulk(recipients)
 
-        mock_smtp_instance.send.assert_called_once_with(
-            "Account Transfer History 2025-01-08",
-            "Company account history: []",
-            "company@example.com",
-        )
-        assert result is True
-
-    @patch("src.account.BusinessAccount.validate_nip_in_mf")
-    @patch("src.account.SMTPClient")
-    @patch("src.account.datetime")
-    def test_send_history_with_different_date_format(
-        self, mock_datetime, mock_smtp_class, mock_validate_nip
-    ):
-        """Test that date format is correct (YYYY-MM-DD)"""
-        mock_validate_nip.return_value = True
-        mock_datetime.now.return_value.strftime.return_value = "2025-12-25"
-        mock_smtp_instance = MagicMock()
-        mock_smtp_instance.send.return_value = True
-        mock_smtp_class.return_value = mock_smtp_instance
-
-        account = BusinessAccount("Test Company", "1234567890")
-        account.incoming_transfer(1000)
-
-        result = account.send_history_via_email("test@example.com")
-
-        assert (
-            mock_smtp_instance.send.call_args[0][0]
-            == "Account Transfer History 2025-12-25"
-        )
-        assert result is True
-
-    @patch("src.account.BusinessAccount.validate_nip_in_mf")
-    @patch("src.account.SMTPClient")
-    @patch("src.account.datetime")
-    def test_send_history_verifies_call_args(
-        self, mock_datetime, mock_smtp_class, mock_validate_nip
-    ):
-        """Test using call_args to verify method was called with correct arguments"""
-        mock_validate_nip.return_value = True
-        mock_datetime.now.return_value.strftime.return_value = "2025-01-08"
-        mock_smtp_instance = MagicMock()
-        mock_smtp_instance.send.return_value = True
-        mock_smtp_class.return_value = mock_smtp_instance
-
-        account = BusinessAccount("Test Company", "1234567890")
-        account.incoming_transfer(5000)
-        account.outgoing_transfer(1000)
-
-        result = account.send_history_via_email("business@example.com")
-
-        call_args = mock_smtp_instance.send.call_args
-        assert call_args[0][0] == "Account Transfer History 2025-01-08"
-        assert call_args[0][1] == "Company account history: [5000, -1000]"
-        assert call_args[0][2] == "business@example.com"
-        assert result is True
+        assert sent == 2
+        assert len(created) == 1
+        subject = "Account Transfer History 2025-01-08"
+        assert smtp_stub.calls == [
+            (subject, "Personal account history: [100]", "jan@example.com"),
+            (subject, "Company account history: []", "company@example.com"),
+            (subject, "Personal account history: [100]", "copy@example.com"),
+        ]
@@ -1,12 +1,5 @@
 import pytest
 
-from src.account import PersonalAccount
-
-
-@pytest.fixture
-def personal_account():
-    return PersonalAccount("Jan", "Kowalski", 100.0, "06241114012")
-
 
 @pytest.mark.parametrize(
     "history, loan_amount, expected_result, expected_balance",
@@ -28,7 +21,7 @@ def test_submit_for_loan(
     granted = personal_account.submit_for_loan(loan_amount)
 
     assert granted is expected_result
-    assert personal_account.balance == expected_balance
+    assert personal_account.balance == pytest.approx(expected_balance)
 
     if expected_result:
         assert len(personal_account.historia) == initial_history_len + 1
@@ -1,44 +1,49 @@
 import pytest
-from mongomock import MongoClient
 
 from src.account import PersonalAccount
-from src.repositories.mongo_repository import MongoAccountsRepository
 
 
-@pytest.fixture
-def mongo_repo():
-    """Create a MongoAccountsRepository with mongomock client"""
-    client = MongoClient()
-    repo = MongoAccountsRepository(
-        client=client,
-        database_name="test_bank_app",
-        collection_name="accounts",
-    )
-    yield repo
-    repo.clear()
-    client.close()
-
-
-@pytest.fixture
+# The repository stores a copy of each account's fields and no test here mutates
+# these objects, so they are built once per module instead of once per test.
+@pytest.fixture(scope="module")
 def account_jan():
     return PersonalAccount("Jan", "Kowalski", 100.0, "80010112345")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def account_anna():
     return PersonalAccount("Anna", "Nowak", 200.0, "90020254321")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def account_piotr():
     return PersonalAccount("Piotr", "Wiśniewski", 300.0, "85050598765")
 
 
+def _make_account_with_deltas(deltas, promo_code=None):
+    """Jan Kowalski with 1000.0, then positive deltas in and negative ones out"""
+    account = PersonalAccount(
+        "Jan", "Kowalski", 1000.0, "80010112345", promo_code=promo_code
+    )
+    for delta in deltas:
+        if delta > 0:
+            account.incoming_transfer(delta)
+        else:
+            account.outgoing_transfer(-delta)
+    return account
+
+
+@pytest.fixture
+def seeded_repo(mongo_repo, account_jan, account_anna):
+    """mongo_repo holding Jan and Anna, written in one save_all() batch"""
+    mongo_repo.save_all([account_jan, account_anna])
+    return mongo_repo
+
+
 class TestMongoAccountRepository:
     """Tests for MongoDB repository implementation"""
 
     def test_add_account(self, mongo_repo, account_jan):
-        """Test adding an account to MongoDB"""
         mongo_repo.add(account_jan)
 
         assert mongo_repo.count() == 1
@@ -51,19 +56,14 @@ class TestMongoAccountRepository:
     def test_add_multiple_accounts(
         self, mongo_repo, account_jan, account_anna, account_piotr
     ):
-        """Test adding multiple accounts"""
         mongo_repo.add(account_jan)
         mongo_repo.add(account_anna)
         mongo_repo.add(account_piotr)
 
         assert mongo_repo.count() == 3
 
-    def test_find_by_pesel_found(self, mongo_repo, account_jan, account_anna):
-        """Test finding an account by PESEL when it exists"""
-        mongo_repo.add(account_jan)
-        mongo_repo.add(account_anna)
-
-        found = mongo_repo.find_by_pesel("90020254321")
+    def test_find_by_pesel_found(self, seeded_repo):
+        found = seeded_repo.find_by_pesel("90020254321")
         assert found is not None
         assert found.first_name == "Anna"
         assert found.last_name == "Nowak"
@@ -76,93 +76,61 @@ class TestMongoAccountRepository:
         found = mongo_repo.find_by_pesel("99999999999")
         assert found is None
 
-    def test_get_all_accounts(self, mongo_repo, account_jan, account_anna):
-        """Test retrieving all accounts"""
-        mongo_repo.add(account_jan)
-        mongo_repo.add(account_anna)
-
-        accounts = mongo_repo.get_all()
+    def test_get_all_accounts(self, seeded_repo):
+        accounts = seeded_repo.get_all()
         assert len(accounts) == 2
-        pesels = [acc.pesel for acc in accounts]
-        assert "80010112345" in pesels
-        assert "90020254321" in pesels
+        assert {acc.pesel for acc in accounts} == {"80010112345", "90020254321"}
+
+    def test_iter_all_accounts(self, seeded_repo):
+        """Test iterating over accounts through the interface default"""
+        pesels = {acc.pesel for acc in seeded_repo.iter_all()}
+        assert pesels == {"80010112345", "90020254321"}
 
     def test_get_all_empty(self, mongo_repo):
-        """Test retrieving all accounts when repository is empty"""
         accounts = mongo_repo.get_all()
         assert accounts == []
 
-    def test_count_accounts(self, mongo_repo, account_jan, account_anna, account_piotr):
-        """Test counting accounts"""
-        assert mongo_repo.count() == 0
-
-        mongo_repo.add(account_jan)
-        assert mongo_repo.count() == 1
-
-        mongo_repo.add(account_anna)
-        assert mongo_repo.count() == 2
-
-        mongo_repo.add(account_piotr)
-        assert mongo_repo.count() == 3
-
-    def test_update_account_first_name(self, mongo_repo, account_jan):
-        """Test updating account first name"""
-        mongo_repo.add(account_jan)
-
-        updated = mongo_repo.update("80010112345", first_name="Janusz")
-        assert updated is not None
-        assert updated.first_name == "Janusz"
-        assert updated.last_name == "Kowalski"
-
-        # Verify persistence
-        found = mongo_repo.find_by_pesel("80010112345")
-        assert found.first_name == "Janusz"
-
-    def test_update_account_last_name(self, mongo_repo, account_jan):
-        """Test updating account last name"""
-        mongo_repo.add(account_jan)
-
-        updated = mongo_repo.update("80010112345", last_name="Kowalewski")
-        assert updated is not None
-        assert updated.first_name == "Jan"
-        assert updated.last_name == "Kowalewski"
-
-    def test_update_account_both_names(self, mongo_repo, account_jan):
-        """Test updating both first and last names"""
+    @pytest.mark.parametrize("stored", [0, 1, 2, 3])
+    def test_count_accounts(
+        self, mongo_repo, account_jan, account_anna, account_piotr, stored
+    ):
+        mongo_repo.save_all([account_jan, account_anna, account_piotr][:stored])
+        assert mongo_repo.count() == stored
+
+    @pytest.mark.parametrize(
+        "changes, expected",
+        [
+            ({"first_name": "Janusz"}, ("Janusz", "Kowalski")),
+            ({"last_name": "Kowalewski"}, ("Jan", "Kowalewski")),
+            (
+                {"first_name": "Janusz", "last_name": "Kowalewski"},
+                ("Janusz", "Kowalewski"),
+            ),
+            ({"first_name": None, "last_name": None}, ("Jan", "Kowalski")),
+        ],
+        ids=["first_name", "last_name", "both_names", "no_changes"],
+    )
+    def test_update_account(self, mongo_repo, account_jan, changes, expected):
+        """Test updating account names, including a no-op update"""
         mongo_repo.add(account_jan)
 
-        updated = mongo_repo.update(
-            "80010112345", first_name="Janusz", last_name="Kowalewski"
-        )
+        updated = mongo_repo.update("80010112345", **changes)
         assert updated is not None
-        assert updated.first_name == "Janusz"
-        assert updated.last_name == "Kowalewski"
+        assert (updated.first_name, updated.last_name) == expected
 
     def test_update_nonexistent_account(self, mongo_repo):
         """Test updating an account that doesn't exist"""
         updated = mongo_repo.update("99999999999", first_name="Test")
         assert updated is None
 
-    def test_update_with_no_changes(self, mongo_repo, account_jan):
-        """Test updating with both parameters None returns existing account"""
-        mongo_repo.add(account_jan)
-        updated = mongo_repo.update("80010112345", first_name=None, last_name=None)
-        assert updated is not None
-        assert updated.first_name == "Jan"
-        assert updated.last_name == "Kowalski"
+    def test_delete_account(self, seeded_repo):
+        assert seeded_repo.count() == 2
 
-    def test_delete_account(self, mongo_repo, account_jan, account_anna):
-        """Test deleting an account"""
-        mongo_repo.add(account_jan)
-        mongo_repo.add(account_anna)
-
-        assert mongo_repo.count() == 2
-
-        result = mongo_repo.delete("80010112345")
+        result = seeded_repo.delete("80010112345")
         assert result is True
-        assert mongo_repo.count() == 1
+        assert seeded_repo.count() == 1
 
-        found = mongo_repo.find_by_pesel("80010112345")
+        found = seeded_repo.find_by_pesel("80010112345")
         assert found is None
 
     def test_delete_nonexistent_account(self, mongo_repo, account_jan):
@@ -176,10 +144,7 @@ class TestMongoAccountRepository:
     def test_clear_all_accounts(
         self, mongo_repo, account_jan, account_anna, account_piotr
     ):
-        """Test clearing all accounts"""
-        mongo_repo.add(account_jan)
-        mongo_repo.add(account_anna)
-        mongo_repo.add(account_piotr)
+        mongo_repo.save_all([account_jan, account_anna, account_piotr])
 
         assert mongo_repo.count() == 3
 
@@ -187,13 +152,18 @@ class TestMongoAccountRepository:
         assert mongo_repo.count() == 0
         assert mongo_repo.get_all() == []
 
+    def test_drop_collection_keeps_unique_pesel_index(self, seeded_repo, account_jan):
+        """drop_collection empties the repo and re-creates the PESEL index"""
+        seeded_repo.drop_collection()
+        assert seeded_repo.count() == 0
+
+        seeded_repo.add(account_jan)
+        with pytest.raises(Exception):  # DuplicateKeyError
+            seeded_repo.add(account_jan)
+
     def test_account_with_history_preserved(self, mongo_repo):
         """Test that account history is preserved in MongoDB"""
-        account = PersonalAccount("Jan", "Kowalski", 1000.0, "80010112345")
-        account.incoming_transfer(500)
-        account.outgoing_transfer(100)
-
-        mongo_repo.add(account)
+        mongo_repo.add(_make_account_with_deltas((500, -100)))
 
         found = mongo_repo.find_by_pesel("80010112345")
         assert found is not None
@@ -214,9 +184,7 @@ class TestMongoAccountRepository:
 
     def test_account_balance_preserved_after_update(self, mongo_repo):
         """Test that balance is preserved when updating account"""
-        account = PersonalAccount("Jan", "Kowalski", 1000.0, "80010112345")
-        account.incoming_transfer(500)
-        mongo_repo.add(account)
+        mongo_repo.add(_make_account_with_deltas((500,)))
 
         # Update name
         mongo_repo.update("80010112345", first_name="Janusz")
@@ -249,10 +217,7 @@ class TestMongoAccountRepository:
 
     def test_account_to_dict_conversion(self, mongo_repo):
         """Test account serialization to dictionary"""
-        account = PersonalAccount(
-            "Jan", "Kowalski", 1000.0, "80010112345", promo_code="PROM_123"
-        )
-        account.incoming_transfer(100)
+        account = _make_account_with_deltas((100,), promo_code="PROM_123")
 
         doc = mongo_repo._account_to_dict(account)
 
@@ -288,8 +253,7 @@ class TestMongoAccountRepository:
         # Add accounts
         acc1 = PersonalAccount("Jan", "Kowalski", 1000.0, "80010112345")
         acc2 = PersonalAccount("Anna", "Nowak", 2000.0, "90020254321")
-        mongo_repo.add(acc1)
-        mongo_repo.add(acc2)
+        mongo_repo.save_all([acc1, acc2])
 
         assert mongo_repo.count() == 2
 
@@ -331,13 +295,10 @@ class TestMongoAccountRepository:
         pesels = {acc.pesel for acc in mongo_repo.get_all()}
         assert pesels == {"90020254321", "85050598765"}
 
-    def test_load_all_returns_all_accounts(self, mongo_repo, account_jan, account_anna):
+    def test_load_all_returns_all_accounts(self, seeded_repo):
         """load_all should return every stored account"""
-        mongo_repo.save_all([account_jan, account_anna])
-
-        loaded_accounts = mongo_repo.load_all()
+        loaded_accounts = seeded_repo.load_all()
 
         assert len(loaded_accounts) == 2
         pesels = {acc.pesel for acc in loaded_accounts}
-        assert "80010112345" in pesels
-        assert "90020254321" in pesels
+        assert pesels == {"80010112345", "90020254321"}
@@ -0,0 +1,47 @@
+import time
+
+import pytest
+
+from src.account import PersonalAccount
+from src.registry import AccountRegistry
+
+N_ACCOUNTS = 10_000
+# Roughly 10x what a dict-backed lookup needs, even under coverage tracing; a
+# linear scan over 10k accounts per lookup would take seconds instead
+LOOKUP_BUDGET = 0.25
+
+
+def test_lookup_scales():
+    registry = AccountRegistry()
+    pesels = [f"{i:011d}" for i in range(N_ACCOUNTS)]
+    for pesel in pesels:
+        registry.add_account(PersonalAccount("Jan", "Kowalski", 0.0, pesel))
+
+    find, now = registry.find_account_by_pesel, time.perf_counter
+    start = now()
+    for pesel in pesels:
+        find(pesel)
+    elapsed = now() - start
+
+    assert registry.find_account_by_pesel(pesels[-1]).pesel == pesels[-1]
+    assert elapsed < LOOKUP_BUDGET, f"{N_ACCOUNTS} lookups took {elapsed:.3f}s"
+
+
+@pytest.mark.benchmark(group="registry-add")
+def test_bench_add_10k(benchmark, request):
+    """Filling a registry must stay linear, each add pays one duplicate check"""
+    if not request.config.getoption("benchmark_enable"):
+        pytest.skip("benchmark only runs with --benchmark-enable")
+    accounts = [
+        PersonalAccount("Jan", "Kowalski", 0.0, f"{i:011d}") for i in range(N_ACCOUNTS)
+    ]
+
+    def fill(registry):
+        for account in accounts:
+            registry.add_account(account)
+        return registry
+
+    registry = benchmark.pedantic(
+        fill, setup=lambda: ((AccountRegistry(),), {}), rounds=5
+    )
+    assert registry.get_account_count() == N_ACCOUNTS
@@ -1,78 +1,53 @@
-from unittest.mock import patch
+import time
 
 import pytest
 
-from src.account import BusinessAccount, PersonalAccount
 
-
-@pytest.fixture
-def personal_account():
-    return PersonalAccount("Jan", "Kowalski", 100.0, "06241114012")
-
-
-@pytest.fixture
-def business_account():
-    with patch("src.account.requests.get") as mock_get:
-        mock_response = mock_get.return_value
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "result": {"subject": {"nip": "1234567890", "statusVat": "Czynny"}}
-        }
-        account = BusinessAccount("Test Corp", "1234567890")
-        account.balance = 100.0
-        return account
-
-
-def test_incoming_transfer(personal_account):
-    personal_account.incoming_transfer(50.0)
-    assert personal_account.balance == 150.0
-    assert personal_account.historia == [50.0]
-
-
-def test_outgoing_transfer_success(personal_account):
-    personal_account.outgoing_transfer(50.0)
-    assert personal_account.balance == 50.0
-    assert personal_account.historia == [-50.0]
-
-
-def test_outgoing_transfer_insufficient_funds(personal_account):
-    personal_account.outgoing_transfer(150.0)
-    assert personal_account.balance == 100.0
-    assert personal_account.historia == []
+def _approx_state(balance, history):
+    """Expected (balance, historia) pair for a single tuple comparison"""
+    return pytest.approx(balance), pytest.approx(history)
 
 
 @pytest.mark.parametrize(
     #
-    "transfer_amount, expected_balance, expected_history",
+    "method, amount, expected",
     [
-        (50.0, 49.0, [-50.0, -1.0]),
-        (100.0, -1.0, [-100.0, -1.0]),
-        (101.0, 100.0, []),
+        ("incoming_transfer", 50.0, (150.0, (50.0,))),
+        ("outgoing_transfer", 50.0, (50.0, (-50.0,))),
+        ("outgoing_transfer", 150.0, (100.0, ())),
+        ("express_transfer", 50.0, (49.0, (-50.0, -1.0))),
+        ("express_transfer", 100.0, (-1.0, (-100.0, -1.0))),
+        ("express_transfer", 101.0, (100.0, ())),
+    ],
+    ids=[
+        "incoming",
+        "outgoing",
+        "outgoing_insufficient_funds",
+        "express",
+        "express_to_debit",
+        "express_over_limit",
     ],
 )
-def test_express_transfer_personal(
-    personal_account, transfer_amount, expected_balance, expected_history
-):
-    personal_account.express_transfer(transfer_amount)
-    assert personal_account.balance == expected_balance
-    assert personal_account.historia == expected_history
+def test_personal_transfer(personal_account, method, amount, expected):
+    getattr(personal_account, method)(amount)
+    state = (personal_account.balance, personal_account.historia_snapshot)
+    assert state == _approx_state(*expected)
 
 
 @pytest.mark.parametrize(
     #
-    "transfer_amount, expected_balance, expected_history",
+    "method, amount, expected",
     [
-        (50.0, 45.0, [-50.0, -5.0]),
-        (100.0, -5.0, [-100.0, -5.0]),
-        (101.0, 100.0, []),
+        ("express_transfer", 50.0, (45.0, (-50.0, -5.0))),
+        ("express_transfer", 100.0, (-5.0, (-100.0, -5.0))),
+        ("express_transfer", 101.0, (100.0, ())),
     ],
+    ids=["express", "express_to_debit", "express_over_limit"],
 )
-def test_express_transfer_business(
-    business_account, transfer_amount, expected_balance, expected_history
-):
-    business_account.express_transfer(transfer_amount)
-    assert business_account.balance == expected_balance
-    assert business_account.historia == expected_history
+def test_business_transfer(business_account, method, amount, expected):
+    getattr(business_account, method)(amount)
+    state = (business_account.balance, business_account.historia_snapshot)
+    assert state == _approx_state(*expected)
 
 
 def test_history_example(personal_account):
@@ -82,5 +57,19 @@ def test_history_example(personal_account):
     personal_account.incoming_transfer(500.0)
     personal_account.express_transfer(300.0)
 
-    assert personal_account.balance == 199.0
-    assert personal_account.historia == [500.0, -300.0, -1.0]
+    state = (personal_account.balance, personal_account.historia_snapshot)
+    assert state == _approx_state(199.0, (500.0, -300.0, -1.0))
+
+
+def test_history_scales(personal_account):
+    # Several times the coverage-traced runtime; quadratic growth would blow past it
+    budget, transfers = 1.0, 100_000
+    incoming, now = personal_account.incoming_transfer, time.perf_counter
+    start = now()
+    for _ in range(transfers):
+        incoming(1)
+    elapsed = now() - start
+
+    assert len(personal_account.historia) == transfers
+    assert personal_account.balance == pytest.approx(100.0 + transfers)
+    assert elapsed < budget, f"{transfers} transfers took {elapsed:.3f}s"